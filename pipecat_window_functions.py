@@ -4,7 +4,11 @@ Provides clean interfaces for LLM tool calls to control application windows.
 """
 
 import asyncio
-from typing import Dict, List, Optional
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 
 from window_control import WindowController
 
@@ -12,16 +16,37 @@ from pipecat.adapters.schemas.function_schema import FunctionSchema
 from pipecat.services.llm_service import FunctionCallParams
 from pipecat.processors.frameworks.rtvi import RTVIServerMessageFrame
 
-# Global controller instance (singleton)
+# Global controller instance (singleton), created under _controller_lock
 _controller = None
+_controller_lock = threading.Lock()
 
 
 def _get_controller() -> WindowController:
-    """Get or create the global window controller."""
-    global _controller
-    if _controller is None:
-        _controller = WindowController()
-    return _controller
+    """
+    Create the global window controller on first use.
+
+    The first call rebinds _get_controller to a closure that returns the
+    controller directly, so later tool calls skip the None check. The lock
+    makes sure concurrent first calls share a single controller.
+    """
+    global _controller, _get_controller
+    with _controller_lock:
+        if _controller is None:
+            _controller = WindowController()
+        controller = _controller
+        _get_controller = lambda: controller
+    return controller
+
+
+# Controller calls block on subprocesses, sleeps and cache writes, so handlers run
+# them off the event loop. A single worker keeps tool calls in arrival order.
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="window-control")
+
+
+async def _run_blocking(fn, *args, **kwargs):
+    """Run a blocking tool function on the window control worker thread."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(fn, *args, **kwargs))
 
 
 # ============================================================================
@@ -37,19 +62,26 @@ def list_windows() -> Dict[str, List[Dict[str, str]]]:
         Dictionary with 'windows' key containing list of window info
     """
     controller = _get_controller()
+    last_used = controller.last_used_window
 
+    # One pass: pull out the last used window so it can go first, keeping the
+    # rest in insertion order
+    last = None
     windows = []
     for name, info in controller.window_map.items():
         window_dict = {
             "name": name,
             "title": info.title or "Unknown",
             "class": info.wm_class or "Unknown",
-            "is_last_used": name == controller.last_used_window,
+            "is_last_used": name == last_used,
         }
-        windows.append(window_dict)
+        if window_dict["is_last_used"]:
+            last = window_dict
+        else:
+            windows.append(window_dict)
 
-    # Sort by last used (most recent first)
-    windows.sort(key=lambda x: x["is_last_used"], reverse=True)
+    if last:
+        windows = [last] + windows
 
     return {
         "success": True,
@@ -59,14 +91,6 @@ def list_windows() -> Dict[str, List[Dict[str, str]]]:
     }
 
 
-async def handle_list_windows(params: FunctionCallParams):
-    """
-    Handle list_windows function call for Pipecat.
-    """
-    result = list_windows()
-    await params.result_callback(result)
-
-
 def remember_window(name: str, wait_seconds: int = 3) -> Dict[str, any]:
     """
     Remember/save the currently focused window with a given name.
@@ -111,8 +135,9 @@ async def handle_remember_window(params: FunctionCallParams):
     """
     Handle remember_window function call for Pipecat.
     """
-    name = params.arguments.get("name")
-    seconds = params.arguments.get("seconds", 3)
+    args = params.arguments
+    name = args.get("name")
+    seconds = args.get("seconds", 3)
     await params.llm.push_frame(
         RTVIServerMessageFrame(
             data={
@@ -125,7 +150,7 @@ async def handle_remember_window(params: FunctionCallParams):
         )
     )
     await asyncio.sleep(0.1)
-    result = remember_window(name, seconds)
+    result = await _run_blocking(remember_window, name, seconds)
     await params.result_callback(result)
 
 
@@ -158,9 +183,14 @@ def send_text_to_window(
         }
 
     try:
+        # Focus the window once, then send the text and keys into it
+        if not controller.focus_window(window_name):
+            target = window_name or controller.last_used_window or "default"
+            return {"success": False, "error": f"Failed to focus window '{target}'"}
+
         # Special casing "escape" to send escape key
         if text == "escape":
-            controller.send_key_to_window("escape", window_name)
+            controller.send_key("escape")
             return {
                 "success": True,
                 "message": "Escape sent to window",
@@ -168,11 +198,11 @@ def send_text_to_window(
             }
 
         # Send the text
-        controller.send_keystrokes_to_window(text, window_name)
+        controller.send_keystrokes(text)
 
         # Send newline if requested
         if send_newline:
-            controller.send_key_to_window("enter", window_name)
+            controller.send_key("enter")
 
         # Determine which window was used
         target_window = window_name or controller.last_used_window or "default"
@@ -192,10 +222,11 @@ async def handle_send_text_to_window(params: FunctionCallParams):
     """
     Handle send_text_to_window function call for Pipecat.
     """
-    edited_text = params.arguments.get("edited_text")
-    raw_text = params.arguments.get("raw_text")
-    window_name = params.arguments.get("window_name", None)
-    send_newline = params.arguments.get("send_newline", True)
+    args = params.arguments
+    edited_text = args.get("edited_text")
+    raw_text = args.get("raw_text")
+    window_name = args.get("window_name", None)
+    send_newline = args.get("send_newline", True)
     await params.llm.push_frame(
         RTVIServerMessageFrame(
             data={
@@ -208,7 +239,7 @@ async def handle_send_text_to_window(params: FunctionCallParams):
             },
         )
     )
-    result = send_text_to_window(edited_text, window_name, send_newline)
+    result = await _run_blocking(send_text_to_window, edited_text, window_name, send_newline)
     await params.result_callback(result)
 
 
@@ -250,15 +281,6 @@ def focus_window(window_name: Optional[str] = None) -> Dict[str, any]:
         return {"success": False, "error": str(e)}
 
 
-async def handle_focus_window(params: FunctionCallParams):
-    """
-    Handle focus_window function call for Pipecat.
-    """
-    window_name = params.arguments.get("window_name", None)
-    result = focus_window(window_name)
-    await params.result_callback(result)
-
-
 # ============================================================================
 # Pipecat Function Schemas
 # ============================================================================
@@ -332,6 +354,31 @@ focus_window_schema = FunctionSchema(
 # Function Registry for Pipecat
 # ============================================================================
 
+
+def _make_handler(fn, schema: FunctionSchema):
+    """
+    Build a Pipecat handler that calls fn with the arguments declared in schema.
+
+    Argument names and defaults are read from the schema once, so each call
+    only does a single lookup per declared argument.
+    """
+    defaults = tuple((key, prop.get("default")) for key, prop in schema.properties.items())
+
+    async def handler(params: FunctionCallParams):
+        args = params.arguments
+        kwargs = {key: args.get(key, default) for key, default in defaults}
+        result = await _run_blocking(fn, **kwargs)
+        await params.result_callback(result)
+
+    handler.__name__ = handler.__qualname__ = f"handle_{schema.name}"
+    handler.__doc__ = f"Handle {schema.name} function call for Pipecat."
+    return handler
+
+
+# Tools that take their arguments straight from the schema
+handle_list_windows = _make_handler(list_windows, list_windows_schema)
+handle_focus_window = _make_handler(focus_window, focus_window_schema)
+
 WINDOW_CONTROL_FUNCTIONS = {
     "list_windows": (list_windows, list_windows_schema),
     "remember_window": (remember_window, remember_window_schema),
@@ -347,11 +394,16 @@ WINDOW_CONTROL_HANDLERS = {
 }
 
 
-def get_window_control_schemas() -> List[FunctionSchema]:
+# Materialized once, after every tool has been registered above
+_ALL_SCHEMAS = tuple(schema for _, schema in WINDOW_CONTROL_FUNCTIONS.values())
+
+
+def get_window_control_schemas() -> Tuple[FunctionSchema, ...]:
     """Get all window control function schemas for Pipecat."""
-    return [schema for _, schema in WINDOW_CONTROL_FUNCTIONS.values()]
+    return _ALL_SCHEMAS
 
 
-def get_window_control_handlers() -> Dict[str, callable]:
-    """Get all window control function handlers for Pipecat."""
-    return WINDOW_CONTROL_HANDLERS
+@functools.cache
+def get_window_control_handlers() -> Mapping[str, callable]:
+    """Get a read-only view of all window control function handlers for Pipecat."""
+    return MappingProxyType(WINDOW_CONTROL_HANDLERS)
@@ -16,10 +16,73 @@ from datetime import datetime
 from pynput.keyboard import Key, Controller as KeyboardController
 from pynput.mouse import Button, Controller as MouseController
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configurable cache file location
 CACHE_DIR = Path.home() / ".pipecat-dictation"
 CACHE_FILE = CACHE_DIR / "window_memory.json"
 
+# Platforms where input goes through ydotool when it is available
+LINUX_PLATFORMS = frozenset({"linux_wayland", "linux_x11"})
+
+# Key names accepted by send_key, mapped to ydotool key names
+YDOTOOL_KEYS = {
+    "enter": "enter",
+    "tab": "tab",
+    "space": "space",
+    "backspace": "backspace",
+    "delete": "delete",
+    "escape": "escape",
+    "up": "up",
+    "down": "down",
+    "left": "left",
+    "right": "right",
+}
+
+# Key names accepted by send_key, mapped to pynput keys
+PYNPUT_KEYS = {
+    "enter": Key.enter,
+    "tab": Key.tab,
+    "space": Key.space,
+    "backspace": Key.backspace,
+    "delete": Key.delete,
+    "escape": Key.esc,
+    "up": Key.up,
+    "down": Key.down,
+    "left": Key.left,
+    "right": Key.right,
+}
+
+
+def _json_loads(data: bytes):
+    """Decode JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(data) -> bytes:
+    """Encode data as indented JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+# (epoch second, ISO timestamp) of the last formatted "updated" value
+_iso_cache: Tuple[int, str] = (-1, "")
+
+
+def _now_iso_cached() -> str:
+    """Return the current time in ISO format, formatting at most once per second."""
+    global _iso_cache
+    second = int(time.time())
+    if second != _iso_cache[0]:
+        _iso_cache = (second, datetime.fromtimestamp(second).isoformat())
+    return _iso_cache[1]
+
 
 @dataclass
 class WindowInfo:
@@ -95,7 +158,7 @@ class WindowController:
 
         # Check ydotool availability on Linux
         self.has_ydotool = False
-        if self.platform in ["linux_wayland", "linux_x11"]:
+        if self.platform in LINUX_PLATFORMS:
             self.has_ydotool = is_ydotool_available()
 
         # Window memory map: name -> WindowInfo
@@ -126,15 +189,13 @@ class WindowController:
             return
 
         try:
-            with open(self.cache_file, "r") as f:
-                data = json.load(f)
-                self.window_map = {
-                    name: WindowInfo.from_dict(info)
-                    for name, info in data.get("windows", {}).items()
-                }
-                self.last_used_window = data.get("last_used")
-                if self.verbose:
-                    print(f"Loaded {len(self.window_map)} windows from cache")
+            data = _json_loads(self.cache_file.read_bytes())
+            self.window_map = {
+                name: WindowInfo.from_dict(info) for name, info in data.get("windows", {}).items()
+            }
+            self.last_used_window = data.get("last_used")
+            if self.verbose:
+                print(f"Loaded {len(self.window_map)} windows from cache")
         except Exception as e:
             print(f"Warning: Could not load cache: {e}")
 
@@ -148,12 +209,17 @@ class WindowController:
             data = {
                 "windows": {name: info.to_dict() for name, info in self.window_map.items()},
                 "last_used": self.last_used_window,
-                "updated": datetime.now().isoformat(),
+                "updated": _now_iso_cached(),
             }
 
-            # Write to cache file
-            with open(self.cache_file, "w") as f:
-                json.dump(data, f, indent=2)
+            # Write to a temp file and swap it in, so an interrupted save never
+            # leaves a truncated cache behind
+            tmp_file = self.cache_file.with_name(self.cache_file.name + ".tmp")
+            with open(tmp_file, "wb") as f:
+                f.write(_json_dumps(data))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.cache_file)
 
             if self.verbose:
                 print(f"Saved {len(self.window_map)} windows to cache")
@@ -170,8 +236,6 @@ class WindowController:
         if self.platform == "linux_wayland":
             # On Wayland with GNOME, use the Windows extension via gdbus
             try:
-                import json as json_module
-
                 # Get the list of windows
                 result = subprocess.run(
                     [
@@ -192,7 +256,7 @@ class WindowController:
                     if output.startswith("('") and output.endswith("',)"):
                         json_str = output[2:-3]
                         json_str = json_str.replace("\\'", "'").replace('\\"', '"')
-                        windows = json_module.loads(json_str)
+                        windows = json.loads(json_str)
 
                         # Find the focused window
                         focused_window_id = None
@@ -227,7 +291,7 @@ class WindowController:
                                 if output.startswith("('") and output.endswith("',)"):
                                     json_str = output[2:-3]
                                     json_str = json_str.replace("\\'", "'").replace('\\"', '"')
-                                    details = json_module.loads(json_str)
+                                    details = json.loads(json_str)
 
                                     # Calculate center position
                                     x = details.get("x", 0)
@@ -354,7 +418,7 @@ class WindowController:
         self.original_position = self.mouse_controller.position
 
         # Focus the window
-        if self.platform in ["linux_wayland", "linux_x11"] and self.has_ydotool:
+        if self.platform in LINUX_PLATFORMS and self.has_ydotool:
             try:
                 subprocess.run(
                     ["ydotool", "mousemove", str(window.position[0]), str(window.position[1])],
@@ -413,7 +477,7 @@ class WindowController:
         """Send keystrokes using the appropriate method."""
         time.sleep(0.1)
 
-        if self.platform in ["linux_wayland", "linux_x11"] and self.has_ydotool:
+        if self.platform in LINUX_PLATFORMS and self.has_ydotool:
             try:
                 subprocess.run(
                     ["ydotool", "type", "--key-delay", "20", "--", text],
@@ -431,21 +495,8 @@ class WindowController:
 
     def send_key(self, key: str):
         """Send a single key press."""
-        if self.platform in ["linux_wayland", "linux_x11"] and self.has_ydotool:
-            key_map = {
-                "enter": "enter",
-                "tab": "tab",
-                "space": "space",
-                "backspace": "backspace",
-                "delete": "delete",
-                "escape": "escape",
-                "up": "up",
-                "down": "down",
-                "left": "left",
-                "right": "right",
-            }
-
-            ydotool_key = key_map.get(key.lower())
+        if self.platform in LINUX_PLATFORMS and self.has_ydotool:
+            ydotool_key = YDOTOOL_KEYS.get(key.lower())
             if ydotool_key:
                 try:
                     subprocess.run(
@@ -455,20 +506,7 @@ class WindowController:
                     pass
         else:
             # Use pynput
-            key_map = {
-                "enter": Key.enter,
-                "tab": Key.tab,
-                "space": Key.space,
-                "backspace": Key.backspace,
-                "delete": Key.delete,
-                "escape": Key.esc,
-                "up": Key.up,
-                "down": Key.down,
-                "left": Key.left,
-                "right": Key.right,
-            }
-
-            pynput_key = key_map.get(key.lower(), key)
+            pynput_key = PYNPUT_KEYS.get(key.lower(), key)
             self.keyboard_controller.tap(pynput_key)
 
     def list_windows(self):